@@ -1,3 +1,4 @@
+from collections import Counter
 from datetime import timedelta
 from enum import unique, IntEnum
 from functools import partial
@@ -963,15 +964,17 @@ def _moving_average_by_time(times, data, delta, num):
 
     # append a nan to the end of the values so that we can do many slices all
     # the way to the end in reduceat
-    values = np.vstack([data, [np.nan] * data.shape[1]])
+    values = np.empty((len(data) + 1, data.shape[1]), dtype=np.float64)
+    values[:-1] = data
+    values[-1] = np.nan
 
     # sum the values in the ranges ``[window_start_ixs, window_stop_ixs)``
     window_sums = np.add.reduceat(values, window_ixs.ravel())[::2]
-    window_sizes = np.diff(window_ixs, axis=1).ravel()
+    window_sizes = window_stop_ixs - window_start_ixs
     # convert window_sizes of 0 to 1 (inplace) to prevent division by zero
     np.clip(window_sizes, 1, None, out=window_sizes)
 
-    out_values = np.stack(window_sums / window_sizes.reshape((-1, 1)))
+    out_values = window_sums / window_sizes.reshape((-1, 1))
 
     return out_times.reshape((-1, 1)), out_values
 
@@ -1018,20 +1021,34 @@ class _DifficultyHitObject:
             ) / 50
 
         # this currently ignores slider length
+        x, y = hit_object.position
         self.normalized_start = self.normalized_end = Position(
-            hit_object.position.x * scaling_factor,
-            hit_object.position.y * scaling_factor,
+            x * scaling_factor,
+            y * scaling_factor,
         )
 
         if previous is None:
             self.strains = 0, 0
         else:
+            # both strains use the elapsed time, so only compute it once
+            seconds_elapsed = (
+                hit_object.time -
+                previous.hit_object.time
+            ).total_seconds()
             self.strains = (
-                self._calculate_strain(previous, self.Strain.speed),
-                self._calculate_strain(previous, self.Strain.aim),
+                self._calculate_strain(
+                    previous,
+                    seconds_elapsed,
+                    self.Strain.speed,
+                ),
+                self._calculate_strain(
+                    previous,
+                    seconds_elapsed,
+                    self.Strain.aim,
+                ),
             )
 
-    def _calculate_strain(self, previous, strain):
+    def _calculate_strain(self, previous, seconds_elapsed, strain):
         result = 0
         scaling = self.weight_scaling[strain]
 
@@ -1042,15 +1059,9 @@ class _DifficultyHitObject:
                 strain
             ) * scaling
 
-        time_elapsed = (
-            self.hit_object.time -
-            previous.hit_object.time
-        ).total_seconds() * 1000
-        result /= max(time_elapsed, 50)
-        decay = (
-            self.decay_base[strain] **
-            (time_elapsed / 1000)
-        )
+        # only the strain scaling needs the elapsed time in milliseconds
+        result /= max(seconds_elapsed * 1000, 50)
+        decay = self.decay_base[strain] ** seconds_elapsed
         return previous.strains[strain] * decay + result
 
     def _distance(self, previous):
@@ -1067,9 +1078,9 @@ class _DifficultyHitObject:
         distance : float
             The absolute difference between the two hit objects.
         """
-        start = self.normalized_start
-        end = previous.normalized_end
-        return np.sqrt((start.x - end.x) ** 2 + (start.y - end.y) ** 2)
+        start_x, start_y = self.normalized_start
+        end_x, end_y = previous.normalized_end
+        return np.sqrt((start_x - end_x) ** 2 + (start_y - end_y) ** 2)
 
     def _spacing_weight(self, distance, strain):
         if strain == self.Strain.speed:
@@ -1262,6 +1273,9 @@ class Beatmap:
         self._speed_stars_cache = {}
         self._rhythm_awkwardness_cache = {}
 
+        # cache the per hit object difficulty with different mod combinations
+        self._hit_object_difficulty_cache = {}
+
     @property
     def display_name(self):
         """The name of the map as it appears in game.
@@ -1504,11 +1518,6 @@ class Beatmap:
                 # cache stacking calculation
                 self._hit_objects_with_stacking[stacking_key] = hit_objects
 
-        if double_time:
-            hit_objects = [ob.double_time for ob in hit_objects]
-        elif half_time:
-            hit_objects = [ob.half_time for ob in hit_objects]
-
         keep_classes = []
         if spinners:
             keep_classes.append(Spinner)
@@ -1516,9 +1525,19 @@ class Beatmap:
             keep_classes.append(Circle)
         if sliders:
             keep_classes.append(Slider)
+        keep_classes = tuple(keep_classes)
+
+        # filter before applying the time modification so that both happen in
+        # a single pass and dropped objects are never modified
+        hit_objects = (ob for ob in hit_objects if
+                       isinstance(ob, keep_classes))
+
+        if double_time:
+            return tuple(ob.double_time for ob in hit_objects)
+        elif half_time:
+            return tuple(ob.half_time for ob in hit_objects)
 
-        return tuple(ob for ob in hit_objects if
-                     isinstance(ob, tuple(keep_classes)))
+        return tuple(hit_objects)
 
     def _resolve_stacking(self, hit_objects, ar, cs):
         """
@@ -1703,10 +1722,14 @@ class Beatmap:
 
     @lazyval
     def _hit_object_times(self):
-        """a (sorted) list of hitobject time's, so they can be searched with
-        ``np.searchsorted``
+        """a (sorted) array of hitobject time's, so they can be searched with
+        ``np.searchsorted`` without converting them on every lookup
         """
-        return [hitobj.time for hitobj in self._hit_objects]
+        return np.fromiter(
+            (hitobj.time for hitobj in self._hit_objects),
+            dtype='timedelta64[us]',
+            count=len(self._hit_objects),
+        )
 
     def closest_hitobject(self, t, side="left"):
         """The hitobject closest in time to ``t``.
@@ -1755,6 +1778,13 @@ class Beatmap:
             return hitobj1
         return hitobj2
 
+    @lazyval
+    def _hit_object_counts(self):
+        """The number of hit objects of each type, keyed by the hit object
+        class. This is computed in a single pass over the hit objects.
+        """
+        return Counter(map(type, self._hit_objects))
+
     @lazyval
     def max_combo(self):
         """The highest combo that can be achieved on this beatmap.
@@ -2180,15 +2210,13 @@ class Beatmap:
             max_strain = max(max_strain, difficulty_hit_object.strains[strain])
             previous = difficulty_hit_object
 
-        difficulty = 0
-        weight = 1
-
-        decay_weight = self._decay_weight
-        for strain in sorted(highest_strains, reverse=True):
-            difficulty += weight * strain
-            weight *= decay_weight
+        # convert to a native float64 array once and weight the strains from
+        # highest to lowest by successive powers of the decay weight
+        highest_strains = np.array(highest_strains, dtype=np.float64)
+        highest_strains[::-1].sort()
+        weights = self._decay_weight ** np.arange(len(highest_strains))
 
-        return difficulty
+        return highest_strains @ weights
 
     _star_scaling_factor = 0.0675
     _extreme_scaling_factor = 0.5
@@ -2224,6 +2252,48 @@ class Beatmap:
                               half_time=False):
         """Compute the difficulty of each hit object.
 
+        Parameters
+        ----------
+        easy : bool
+            Compute difficulty with easy.
+        hard_rock : bool
+            Compute difficulty with hard rock.
+        double_time : bool
+            Compute difficulty with double time.
+        half_time : bool
+            Compute difficulty with half time.
+
+        Returns
+        ----------
+        times : np.ndarray
+            Single column array of times as ``timedelta64[ns]``
+        difficulties : np.ndarray
+            Array of difficulties as ``float64``. Speed in the first column,
+            aim in the second.
+        """
+        key = (
+            bool(easy),
+            bool(hard_rock),
+            bool(double_time),
+            bool(half_time),
+        )
+        try:
+            times, strains = self._hit_object_difficulty_cache[key]
+        except KeyError:
+            times, strains = self._hit_object_difficulty_cache[key] = (
+                self._calculate_hit_object_difficulty(*key)
+            )
+
+        # return copies so that callers cannot corrupt the cache
+        return times.copy(), strains.copy()
+
+    def _calculate_hit_object_difficulty(self,
+                                         easy,
+                                         hard_rock,
+                                         double_time,
+                                         half_time):
+        """Compute the difficulty of each hit object.
+
         Parameters
         ----------
         easy : bool
@@ -2260,6 +2330,12 @@ class Beatmap:
         )
         strains = np.empty((len(self._hit_objects) - 1, 2), dtype=np.float64)
 
+        # write each value directly into its cell; assigning a tuple to a row
+        # goes through numpy's much slower sequence conversion
+        times_column = times[:, 0]
+        speed_column = strains[:, _DifficultyHitObject.Strain.speed]
+        aim_column = strains[:, _DifficultyHitObject.Strain.aim]
+
         hit_objects = map(modify, self._hit_objects)
         previous = _DifficultyHitObject(next(hit_objects), radius)
         for i, hit_object in enumerate(hit_objects):
@@ -2268,8 +2344,8 @@ class Beatmap:
                 radius,
                 previous,
             )
-            times[i] = hit_object.time
-            strains[i] = new.strains
+            times_column[i] = hit_object.time
+            speed_column[i], aim_column[i] = new.strains
             previous = new
 
         return times, strains
@@ -2835,7 +2911,7 @@ class Beatmap:
             count_circles = count_hit_objects
             real_accuracy = accuracy
         else:
-            count_circles = len(self.circles)
+            count_circles = self._hit_object_counts[Circle]
             if count_circles:
                 real_accuracy = (
                     (count_300 - (count_hit_objects - count_circles)) * 300.0 +
@@ -120,15 +120,13 @@ class Bezier(Curve):
 
         n = len(points) - 1
         ixs = np.arange(n + 1)
-        return np.sum(
-            (
-                comb(n, ixs) *
-                (1 - t) ** (n - ixs) *
-                t ** ixs
-            )[:, np.newaxis] *
-            self._coordinates,
-            axis=-1,
-        )
+        # a single matrix product of the bernstein basis with the control
+        # points avoids materializing every weighted point before summing
+        return (
+            comb(n, ixs) *
+            (1 - t) ** (n - ixs) *
+            t ** ixs
+        ) @ self._coordinates.T
 
     @lazyval
     def length(self):
@@ -272,11 +270,10 @@ class Perfect(Curve):
 
         coordinates = np.array(points) - _center
 
-        # angles of 3 points to center
-        start_angle, end_angle = np.arctan2(
-            coordinates[::2, 1],
-            coordinates[::2, 0],
-        )
+        # angles of the start and end points to center; there are only two
+        # so ``math.atan2`` is much cheaper than dispatching ``np.arctan2``
+        start_angle = math.atan2(coordinates[0, 1], coordinates[0, 0])
+        end_angle = math.atan2(coordinates[2, 1], coordinates[2, 0])
 
         # normalize so that self._angle is positive
         if end_angle < start_angle:
@@ -316,10 +313,6 @@ class Catmull(Curve):
                            [0,   0,  1,  0],
                            [1,   0,  0,  0]])
 
-        tangents_x = []
-        tangents_y = []
-        self.Cxs = []
-        self.Cys = []
         # The tangent for point i is defined as 0.5 * (P_(i + 1) - P_(i - 1)),
         # so we need to consider the point behind it and the point in front of
         # it. We:
@@ -341,31 +334,27 @@ class Catmull(Curve):
         p_behinds = np.roll(points, -1)
         p_behinds[-1] = p_behinds[-2]
 
-        # we interpolate x and y separately, so track their tangents in two
-        # separate lists.
-        for (p_ahead, p_behind) in zip(p_aheads, p_behinds):
-            tangent = 0.5 * (p_ahead[0] - p_behind[0])
-            tangents_x.append(tangent)
-
-            tangent = 0.5 * (p_ahead[1] - p_behind[1])
-            tangents_y.append(tangent)
+        # each row holds the x and y tangent for the corresponding point
+        tangents = 0.5 * (p_aheads - p_behinds)
 
         # for each curve we consider its start and end point (and start and end
         # tangent). This means the number of curves will be one less than the
-        # number of points.
-        for ((p1, p2), (t1, t2)) in zip(zip(points, points[1:]),
-                                        zip(tangents_x, tangents_x[1:])):
-            Cx = np.array([p1[0], p2[0], t1, t2])
-            # make it a column vector
-            Cx = Cx[:, np.newaxis]
-            self.Cxs.append(Cx)
-
-        for ((p1, p2), (t1, t2)) in zip(zip(points, points[1:]),
-                                        zip(tangents_y, tangents_y[1:])):
-            Cy = np.array([p1[1], p2[1], t1, t2])
-            # make it a column vector
-            Cy = Cy[:, np.newaxis]
-            self.Cys.append(Cy)
+        # number of points. Each curve gets a 4x2 block of coefficients where
+        # the first column is used to interpolate x and the second is used to
+        # interpolate y, so both axes can be evaluated with a single matrix
+        # product.
+        self._coefficients = coefficients = np.empty(
+            (len(points) - 1, 4, 2),
+            dtype=np.float64,
+        )
+        coefficients[:, 0] = points[:-1]
+        coefficients[:, 1] = points[1:]
+        coefficients[:, 2] = tangents[:-1]
+        coefficients[:, 3] = tangents[1:]
+
+        # column vector views of the coefficients for each axis
+        self.Cxs = coefficients[..., :1]
+        self.Cys = coefficients[..., 1:]
 
     def __call__(self, t):
         # for consistency with notes linked above
@@ -376,22 +365,18 @@ class Catmull(Curve):
         # amount of time to traverse regardless of its size), we can get the
         # curve that should be used for a certain t by multiplying by the
         # number of curves and rounding up.
-        curve_index = math.ceil(t * len(self.Cxs)) - 1
-        Cx = self.Cxs[curve_index]
-        Cy = self.Cys[curve_index]
+        curve_index = math.ceil(t * len(self._coefficients)) - 1
+        C = self._coefficients[curve_index]
 
-        px = (S @ self.h) @ Cx
-        py = (S @ self.h) @ Cy
+        px, py = (S @ self.h) @ C
         # A bit of dimensional analysis:
         # S = 1x4
-        # C = 4x1
+        # C = 4x2
         # h = 4x4
         #
-        # P = (S * h) * C = (1x4 * 4x4) * 4x1 = 1x4 * 4x1 = 1x1
-        # Result of multiplication is a 1x1 ndarray so convert to a float.
-        px = float(px)
-        py = float(py)
-        return Position(px, py)
+        # P = (S * h) * C = (1x4 * 4x4) * 4x2 = 1x4 * 4x2 = 1x2
+        # Result of multiplication holds the x and y coordinates.
+        return Position(float(px), float(py))
 
 
 def get_center(a, b, c):
@@ -77,21 +77,27 @@ def _consume_actions(buffer):
     del buffer[:compressed_byte_count]
     decompressed_data = lzma.decompress(compressed_data)
 
+    # test the bits directly instead of unpacking a dict for every action
+    m1 = int(ActionBitMask.m1)
+    m2 = int(ActionBitMask.m2)
+    k1 = int(ActionBitMask.k1)
+    k2 = int(ActionBitMask.k2)
+
     out = []
     offset = 0
     for raw_action in decompressed_data.split(b','):
         if not raw_action:
             continue
         raw_offset, x, y, raw_action_mask = raw_action.split(b'|')
-        action_mask = ActionBitMask.unpack(int(raw_action_mask))
+        action_mask = int(raw_action_mask)
         offset += int(raw_offset)
         out.append(Action(
             datetime.timedelta(milliseconds=offset),
             Position(float(x), float(y)),
-            action_mask['m1'],
-            action_mask['m2'],
-            action_mask['k1'],
-            action_mask['k2'],
+            bool(action_mask & m1),
+            bool(action_mask & m2),
+            bool(action_mask & k1),
+            bool(action_mask & k2),
         ))
     return out
 
@@ -113,7 +119,9 @@ def _within(p1, p2, d):
     bool
         Whether the distance between the points is less than d
     """
-    return (p1.x - p2.x) ** 2 + (p1.y - p2.y) ** 2 < d ** 2
+    x1, y1 = p1
+    x2, y2 = p2
+    return (x1 - x2) ** 2 + (y1 - y2) ** 2 < d ** 2
 
 
 def _pressed(datum):
@@ -507,13 +515,19 @@ class Replay:
         Returns
         -------
         replays : list[Replay]
-            The parsed replay objects.
+            The parsed replay objects, ordered by path.
 
         Raises
         ------
         ValueError
             Raised when any file cannot be parsed as an ``.osr`` file.
         """
+        # filter on the cached entry names before touching any file contents
+        paths = sorted(
+            entry.path
+            for entry in os.scandir(path)
+            if entry.name.endswith('.osr')
+        )
         return [
             cls.from_path(
                 p,
@@ -523,8 +537,7 @@ class Replay:
                 retrieve_beatmap=retrieve_beatmap,
                 beatmap=beatmap
             )
-            for p in os.scandir(path)
-            if p.name.endswith('.osr')
+            for p in paths
         ]
 
     @classmethod
@@ -228,3 +228,11 @@ def test_hp(beatmap):
 
 def test_od(beatmap):
     assert beatmap.od() == 9
+
+
+def test_performance_points():
+    beatmap = slider.example_data.beatmaps.sendan_life("Crystal's Garakowa")
+    pp_95, pp_100 = beatmap.performance_points(accuracy=[0.95, 1.0])
+
+    assert isclose(pp_95, 219.09554433691147)
+    assert isclose(pp_100, 274.487178791355)